@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Run all the examples one after another on a single event loop.
+
+Usage (from the project root):
+    python examples
+
+Each example can still be run on its own, e.g. python examples/quick_start.py
+"""
+
+import os
+import asyncio
+import logging
+import concurrent.futures
+
+import manual_mcp_server_example
+import manual_wolfram_alpha_example
+import quick_start
+
+logger = logging.getLogger("examples")
+
+# Run in order so the interactive quick start prompt is not mixed with other output
+EXAMPLES = (
+    manual_mcp_server_example,
+    manual_wolfram_alpha_example,
+    quick_start,
+)
+
+async def run_all():
+    """Run every example on the current event loop, continuing after a failure."""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    for example in EXAMPLES:
+        try:
+            await example.run()
+        except Exception:
+            logger.exception("Example %s failed", example.__name__)
+
+def main():
+    """Run the examples, cancelling leftover tasks and shutting down the executor afterwards."""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop is None:
+        asyncio.run(run_all())
+    else:
+        uvloop.run(run_all())
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,23 @@ This demonstrates the manual steps needed for:
 2. Connecting to the server
 3. Executing tools
 4. Handling errors
+
+The install helpers, connect_to_server and MCPSessionPool are duplicated on
+purpose in manual_wolfram_alpha_example.py so that each script can be read
+and run on its own. Apply any fix to both copies.
+
+Optional: install uvloop 0.18 or newer (pip install 'uvloop>=0.18') for a faster event loop.
 """
 
 import os
+import re
 import sys
+import time
 import asyncio
-import subprocess
 import logging
-from pathlib import Path
+import functools
+import importlib.metadata
+from collections import deque
 
 # Configure logging
 logging.basicConfig(
@@ -24,73 +33,151 @@ logging.basicConfig(
 )
 logger = logging.getLogger("manual_mcp_example")
 
-async def install_server(server_name, package_name=None):
-    """Manually install an MCP server using pip."""
-    logger.info(f"Installing MCP server: {server_name}")
+# Extracts the module name from "No module named 'X'" errors
+MISSING_MODULE_RE = re.compile(r"No module named ['\"]([\w\.]+)['\"]")
+
+# Environment variables passed on to launched servers (plus any *_API_KEY and LC_*)
+SERVER_ENV_KEYS = (
+    "PATH", "PYTHONPATH", "PYTHONHOME", "VIRTUAL_ENV", "LD_LIBRARY_PATH",
+    "HOME", "USERPROFILE", "APPDATA", "TEMP", "TMP",
+    # Needed to start processes and load system libraries on Windows
+    "SYSTEMROOT", "WINDIR", "COMSPEC", "PATHEXT",
+    "WOLFRAM_API_KEY", "ACCUWEATHER_API_KEY", "ANTHROPIC_API_KEY",
+    # Proxy and certificate settings for the servers' outbound HTTPS calls
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "ALL_PROXY",
+    "http_proxy", "https_proxy", "no_proxy", "all_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE",
+    # Locale settings
+    "LANG", "LANGUAGE"
+)
+
+# Pooled sessions that responded within this many seconds are not pinged again
+SESSION_HEALTH_INTERVAL = 2.0
+# How long to wait for a health-check ping before reconnecting
+SESSION_PING_TIMEOUT = 0.25
+# Delay before retrying a tool call whose connection was lost
+TOOL_RETRY_DELAY = 0.05
+
+# Maximum number of servers launched at the same time by connect_many
+MAX_CONCURRENT_CONNECTS = 4
+
+# Number of pip stderr lines kept for error reports
+PIP_STDERR_TAIL_LINES = 50
+
+async def _drain_stream(stream, tail=None):
+    """Log a subprocess stream line by line, optionally keeping its last lines."""
+    async for line in stream:
+        text = line.decode(errors="replace").rstrip()
+        logger.debug(text)
+        if tail is not None:
+            tail.append(text)
+
+async def run_pip_install(*packages):
+    """
+    Run pip install and stream its output instead of buffering it.
     
+    Returns a (returncode, stderr_tail) tuple.
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "pip", "install", *packages,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stderr_tail = deque(maxlen=PIP_STDERR_TAIL_LINES)
+    await asyncio.gather(
+        _drain_stream(process.stdout),
+        _drain_stream(process.stderr, stderr_tail)
+    )
+    await process.wait()
+    return process.returncode, "\n".join(stderr_tail)
+
+def build_server_env():
+    """Build the minimal environment a launched server needs."""
+    return {
+        key: value for key, value in os.environ.items()
+        if key in SERVER_ENV_KEYS or key.endswith("_API_KEY") or key.startswith("LC_")
+    }
+
+def is_package_installed(package_name):
+    """Check if a distribution is installed without spawning pip."""
+    try:
+        importlib.metadata.version(package_name)
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+async def install_server(server_name, package_name=None, force=False):
+    """Manually install an MCP server using pip (skipped if already installed unless force)."""
     # Use the server name as package name if not specified
     package_name = package_name or server_name
     
+    if not force and is_package_installed(package_name):
+        logger.info("MCP server %s is already installed", server_name)
+        return True
+    
+    logger.info("Installing MCP server: %s", server_name)
+    
     try:
         # Execute pip install
-        process = await asyncio.create_subprocess_exec(
-            sys.executable, "-m", "pip", "install", package_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        returncode, error_msg = await run_pip_install(package_name)
         
-        if process.returncode == 0:
-            logger.info(f"Successfully installed {server_name}")
+        if returncode == 0:
+            logger.info("Successfully installed %s", server_name)
             return True
         else:
-            error_msg = stderr.decode()
-            logger.error(f"Error installing {server_name}: {error_msg}")
+            logger.error("Error installing %s: %s", server_name, error_msg)
             return False
     except Exception as e:
-        logger.error(f"Exception during installation: {e}")
+        logger.error("Exception during installation: %s", e)
         return False
 
 async def install_dependency(dependency_name):
     """Manually install a dependency for an MCP server."""
-    logger.info(f"Installing dependency: {dependency_name}")
+    logger.info("Installing dependency: %s", dependency_name)
     
     try:
         # Execute pip install
-        process = await asyncio.create_subprocess_exec(
-            sys.executable, "-m", "pip", "install", dependency_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        returncode, error_msg = await run_pip_install(dependency_name)
         
-        if process.returncode == 0:
-            logger.info(f"Successfully installed dependency {dependency_name}")
+        if returncode == 0:
+            logger.info("Successfully installed dependency %s", dependency_name)
             return True
         else:
-            error_msg = stderr.decode()
-            logger.error(f"Error installing dependency {dependency_name}: {error_msg}")
+            logger.error("Error installing dependency %s: %s", dependency_name, error_msg)
             return False
     except Exception as e:
-        logger.error(f"Exception during dependency installation: {e}")
+        logger.error("Exception during dependency installation: %s", e)
         return False
 
+@functools.lru_cache(maxsize=None)
+def load_mcp_symbols():
+    """Import the MCP client components on first use and remember them."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    return ClientSession, StdioServerParameters, stdio_client
+
+@functools.lru_cache(maxsize=None)
+def transport_errors():
+    """Return the exception types that mean the connection to a server was lost."""
+    errors = (ConnectionError, EOFError, TimeoutError, asyncio.TimeoutError)
+    try:
+        import anyio
+    except ImportError:
+        return errors
+    return errors + (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
 async def connect_to_server(server_name):
     """Connect to an MCP server."""
-    logger.info(f"Connecting to server: {server_name}")
+    logger.info("Connecting to server: %s", server_name)
     
     try:
         # First make sure we have MCP installed
         try:
-            import mcp
+            ClientSession, StdioServerParameters, stdio_client = load_mcp_symbols()
         except ImportError:
             logger.info("MCP package not installed, installing now...")
             await install_server("mcp")
-            import mcp
-        
-        # Import required components from MCP
-        from mcp import ClientSession, StdioServerParameters
-        from mcp.client.stdio import stdio_client
+            ClientSession, StdioServerParameters, stdio_client = load_mcp_symbols()
         
         # Create an exit stack for resource management
         from contextlib import AsyncExitStack
@@ -100,10 +187,10 @@ async def connect_to_server(server_name):
         params = StdioServerParameters(
             command="python",
             args=["-m", server_name],
-            env=os.environ.copy()
+            env=build_server_env()
         )
         
-        logger.info(f"Launching server: {server_name}")
+        logger.info("Launching server: %s", server_name)
         
         try:
             # Connect to the server
@@ -118,66 +205,229 @@ async def connect_to_server(server_name):
             # Initialize the session
             await session.initialize()
             
-            logger.info(f"Successfully connected to server: {server_name}")
+            logger.info("Successfully connected to server: %s", server_name)
             return session, exit_stack
         except Exception as e:
-            logger.error(f"Error launching server: {e}")
+            logger.error("Error launching server: %s", e)
             
             # Check if it's a missing module error
-            error_msg = str(e)
-            if "No module named" in error_msg:
-                missing_module = None
-                if "No module named '" in error_msg:
-                    parts = error_msg.split("No module named '")
-                    if len(parts) > 1:
-                        missing_module = parts[1].split("'")[0]
+            match = MISSING_MODULE_RE.search(str(e))
+            if match:
+                missing_module = match.group(1)
+                logger.info("Detected missing dependency: %s", missing_module)
+                logger.info("Attempting to install missing dependency...")
                 
-                if missing_module:
-                    logger.info(f"Detected missing dependency: {missing_module}")
-                    logger.info(f"Attempting to install missing dependency...")
-                    
-                    await install_dependency(missing_module)
-                    
-                    # Try again after installing the dependency
-                    logger.info(f"Retrying server connection after installing dependency...")
-                    return await connect_to_server(server_name)
+                # Close the failed stack so the dead server process is cleaned up
+                await exit_stack.aclose()
+                await install_dependency(missing_module)
+                
+                # Try again after installing the dependency
+                logger.info("Retrying server connection after installing dependency...")
+                return await connect_to_server(server_name)
             
             # If we get here, the error wasn't fixed
             await exit_stack.aclose()
             raise e
+        except BaseException:
+            # Cancelled while launching: close the stack so the server process is not leaked
+            await exit_stack.aclose()
+            raise
     except Exception as e:
-        logger.error(f"Failed to connect to server {server_name}: {e}")
+        logger.error("Failed to connect to server %s: %s", server_name, e)
         raise
 
-async def execute_weather_tool(session, location="London"):
+# Duplicated on purpose in manual_wolfram_alpha_example.py; keep both copies in sync
+class MCPSessionPool:
+    """
+    Keep one MCP session per server open and reuse it across tool calls.
+    
+    Each session is opened and closed by its own owner task. The MCP stdio
+    transport is built on anyio task groups, which must be exited by the
+    task that entered them, so this lets sessions be used, connected
+    concurrently and closed from any task.
+    """
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        # server_name -> (session, stop event, owner task)
+        self._sessions = {}
+        # server_name -> {lowercase tool name: actual tool name}
+        self._tool_index = {}
+        # server_name -> time.monotonic() of the last successful exchange
+        self._last_healthy = {}
+        # server_name -> lock serializing connects to that server
+        self._locks = {}
+    
+    async def get_session(self, server_name):
+        """
+        Return the pooled session for a server, connecting on first use.
+        
+        Concurrent callers for the same server wait for a single launch
+        instead of each starting their own server.
+        """
+        async with self._locks.setdefault(server_name, asyncio.Lock()):
+            if server_name in self._sessions:
+                session = self._sessions[server_name][0]
+                if await self._is_healthy(server_name, session):
+                    return session
+                
+                logger.warning("Session for %s is not responding, reconnecting...", server_name)
+                await self.close(server_name)
+            
+            session = await self._open_session(server_name)
+            
+            try:
+                # List the tools once per connection instead of on every call
+                result = await session.list_tools()
+                tool_names = [tool.name for tool in result.tools]
+            except BaseException:
+                # Don't keep a session whose tools could not be indexed
+                await self.close(server_name)
+                raise
+            
+            logger.info("Available tools: %s", tool_names)
+            self._tool_index[server_name] = {name.lower(): name for name in tool_names if name}
+            self._last_healthy[server_name] = time.monotonic()
+            return session
+    
+    async def _open_session(self, server_name):
+        """Start the owner task for a server and wait until its session is ready."""
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        owner = asyncio.create_task(self._own_session(server_name, ready, stop))
+        
+        try:
+            await asyncio.wait((ready, owner), return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # The caller was cancelled while connecting, so stop the owner as well
+            stop.set()
+            owner.cancel()
+            raise
+        
+        if not ready.done():
+            # The owner task failed before the session was ready; re-raise its error
+            return owner.result()
+        
+        session = ready.result()
+        self._sessions[server_name] = (session, stop, owner)
+        return session
+    
+    async def _own_session(self, server_name, ready, stop):
+        """Open a server connection in this task and keep it open until stop is set."""
+        session, exit_stack = await connect_to_server(server_name)
+        try:
+            ready.set_result(session)
+            await stop.wait()
+        finally:
+            await exit_stack.aclose()
+    
+    async def connect_many(self, server_names, max_concurrency=MAX_CONCURRENT_CONNECTS):
+        """
+        Connect to several servers concurrently.
+        
+        Launch time is bounded by the slowest server rather than the sum of
+        all of them. Returns a {server_name: session} dict.
+        """
+        server_names = list(dict.fromkeys(server_names))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def connect_one(server_name):
+            async with semaphore:
+                return await self.get_session(server_name)
+        
+        # TaskGroup cancels the remaining launches if one fails (Python 3.11+)
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as task_group:
+                tasks = {name: task_group.create_task(connect_one(name)) for name in server_names}
+            return {name: task.result() for name, task in tasks.items()}
+        
+        sessions = await asyncio.gather(*(connect_one(name) for name in server_names))
+        return dict(zip(server_names, sessions))
+    
+    async def _is_healthy(self, server_name, session):
+        """Ping a pooled session unless it responded recently."""
+        if time.monotonic() - self._last_healthy.get(server_name, 0) < SESSION_HEALTH_INTERVAL:
+            return True
+        
+        try:
+            await asyncio.wait_for(session.send_ping(), timeout=SESSION_PING_TIMEOUT)
+        except Exception as e:
+            logger.debug("Health check for %s failed: %s", server_name, e)
+            return False
+        
+        self._last_healthy[server_name] = time.monotonic()
+        return True
+    
+    async def call_tool(self, server_name, tool_name, arguments):
+        """
+        Call a tool on a pooled session.
+        
+        If the connection to the server was lost, reconnect and retry once.
+        Errors reported by the tool itself are raised as they are, so a
+        healthy server is not relaunched and the tool is not run twice.
+        """
+        session = await self.get_session(server_name)
+        try:
+            result = await session.call_tool(tool_name, arguments)
+        except transport_errors() as e:
+            logger.warning("Connection to %s lost (%r), retrying on a new session...", server_name, e)
+            await asyncio.sleep(TOOL_RETRY_DELAY)
+            # Another caller may already have replaced the broken session
+            if self._sessions.get(server_name, (None,))[0] is session:
+                await self.close(server_name)
+            session = await self.get_session(server_name)
+            result = await session.call_tool(tool_name, arguments)
+        
+        self._last_healthy[server_name] = time.monotonic()
+        return result
+    
+    def find_tool(self, server_name, keyword):
+        """Return the first tool on a connected server whose name contains keyword."""
+        index = self._tool_index.get(server_name, {})
+        return next((name for lower, name in index.items() if keyword in lower), None)
+    
+    async def close(self, server_name):
+        """Close the pooled session for a server, if there is one."""
+        self._tool_index.pop(server_name, None)
+        self._last_healthy.pop(server_name, None)
+        entry = self._sessions.pop(server_name, None)
+        if entry:
+            _, stop, owner = entry
+            # The owner task closes the connection it opened
+            stop.set()
+            try:
+                await owner
+            except Exception as e:
+                logger.warning("Error closing session for %s: %s", server_name, e)
+    
+    async def close_all(self):
+        """Close every pooled session."""
+        for server_name in list(self._sessions):
+            await self.close(server_name)
+
+async def execute_weather_tool(pool, server_name, location="London"):
     """Execute a weather tool on the connected server."""
-    logger.info(f"Executing weather tool for location: {location}")
+    logger.info("Executing weather tool for location: %s", location)
     
     try:
-        # List available tools
-        tools = await session.list_tools()
-        tool_names = [tool.get("name") for tool in tools]
-        logger.info(f"Available tools: {tool_names}")
-        
-        # Look for a weather-related tool
-        weather_tool = None
-        for name in tool_names:
-            if "weather" in name.lower():
-                weather_tool = name
-                break
+        # Make sure the server is connected so its tools are indexed
+        await pool.get_session(server_name)
+        
+        # Look up the weather-related tool in the cached tool index
+        weather_tool = pool.find_tool(server_name, "weather")
         
         if not weather_tool:
             logger.error("No weather tool found on this server")
             return {"error": "No weather tool available"}
         
         # Execute the tool
-        logger.info(f"Executing tool: {weather_tool}")
-        result = await session.call_tool(weather_tool, {"location": location})
+        logger.info("Executing tool: %s", weather_tool)
+        result = await pool.call_tool(server_name, weather_tool, {"location": location})
         
         # Check for API key errors
         if isinstance(result, dict) and "error" in result:
             error_msg = result["error"]
-            logger.error(f"Error from tool: {error_msg}")
+            logger.error("Error from tool: %s", error_msg)
             
             if "API key" in error_msg or "Authorization" in error_msg:
                 logger.error("API key error detected")
@@ -186,9 +436,15 @@ async def execute_weather_tool(session, location="London"):
         
         return result
     except Exception as e:
-        logger.error(f"Error executing tool: {e}")
+        logger.error("Error executing tool: %s", e)
         return {"error": str(e)}
 
+def format_result(result):
+    """Format a tool result as indented lines, dispatching on its type once."""
+    if isinstance(result, dict):
+        return "\n".join(f"  {key}: {value}" for key, value in result.items())
+    return f"  {result}"
+
 async def main():
     """Main function demonstrating manual MCP server usage."""
     print("\n================================")
@@ -205,31 +461,29 @@ async def main():
         print("\nFailed to install server. Exiting.")
         return
     
+    # Sessions are pooled so further tool calls reuse the same connection
+    pool = MCPSessionPool()
+    
     try:
-        # Step 2: Connect to the server
-        print("\n--- Step 2: Connecting to Server ---")
-        session, exit_stack = await connect_to_server(server_name)
-        
         try:
+            # Step 2: Connect to the server
+            print("\n--- Step 2: Connecting to Server ---")
+            await pool.get_session(server_name)
+            
             # Step 3: Execute a tool on the server
             print("\n--- Step 3: Executing Tool ---")
-            result = await execute_weather_tool(session, "Paris")
+            result = await execute_weather_tool(pool, server_name, "Paris")
             
             print("\n--- Results ---")
-            if "error" in result:
+            if isinstance(result, dict) and "error" in result:
                 print(f"Error: {result['error']}")
             else:
-                print(f"Weather in Paris:")
-                if isinstance(result, dict):
-                    for key, value in result.items():
-                        print(f"  {key}: {value}")
-                else:
-                    print(f"  {result}")
+                print(f"Weather in Paris:\n{format_result(result)}")
             
         finally:
             # Step 4: Clean up
             print("\n--- Step 4: Cleaning Up ---")
-            await exit_stack.aclose()
+            await pool.close_all()
             print("Disconnected from server")
     
     except Exception as e:
@@ -244,5 +498,17 @@ async def main():
     print("Example completed")
     print("================================")
 
+async def run():
+    """Run the example on an already running event loop."""
+    await main()
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop is None:
+        asyncio.run(main())
+    else:
+        uvloop.run(main()) 
\ No newline at end of file
@@ -4,11 +4,15 @@ State of Mika SDK - Quick Start Example
 
 This example demonstrates the basic usage of the State of Mika SDK (SoM)
 to process natural language requests and access different capabilities.
+
+Optional: install uvloop 0.18 or newer (pip install 'uvloop>=0.18') for a faster event loop.
 """
 
 import os
+import sys
 import asyncio
 import logging
+import threading
 from state_of_mika import SoMAgent
 
 # Configure logging for better visibility
@@ -19,100 +23,202 @@ logging.basicConfig(
 )
 logger = logging.getLogger("som_example")
 
+# Example requests to demonstrate different capabilities
+EXAMPLE_REQUESTS = (
+    "What's the weather like in Tokyo today?",
+    "Search for the latest news about artificial intelligence",
+    "What time is it in New York?",
+    "Solve the equation x^2 + 2x - 3 = 0",
+)
+
+async def handle_request(agent, query):
+    """Process a single natural language request with an already set up agent."""
+    logger.info("Processing request: %s", query)
+    
+    # Process the natural language request
+    result = await agent.process_request(query)
+    
+    # Check if the request was successful
+    if result.get("status") == "success":
+        logger.info("Request successful!")
+        logger.info("Capability used: %s", result.get("capability"))
+        logger.info("Tool used: %s", result.get("tool_name"))
+        
+        # Print the result
+        print(f"\n--- Result for '{query}' ---")
+        print_result(result.get("result"))
+        
+        return result.get("result")
+    else:
+        # Handle errors
+        error = result.get("error")
+        error_type = result.get("error_type")
+        logger.error("Request failed: %s", error)
+        logger.error("Error type: %s", error_type)
+        
+        # Print suggestions
+        print(f"\n--- Error Information for '{query}' ---")
+        print(f"Error: {error}")
+        print(f"Type: {error_type}")
+        print(f"Suggestion: {result.get('suggestion')}")
+        
+        if result.get("missing_api_key"):
+            print(f"\nMissing API key: {result.get('missing_api_key')}")
+            print("Set this environment variable to fix the issue.")
+        
+        return None
+
 async def process_request(query):
     """Process a natural language request using the SoM Agent."""
+    results = await process_requests([query])
+    return results[0]
+
+def start_agent():
+    """Create a SoM Agent and start setting it up in the background."""
     # Create the agent with auto-installation enabled
     agent = SoMAgent(auto_install=True)
     
-    # Set up the agent (loads registry, etc.)
-    await agent.setup()
+    # Set up the agent (loads registry, etc.) without waiting for it yet
+    setup_task = asyncio.create_task(agent.setup())
+    return agent, setup_task
+
+async def close_agent(agent, setup_task):
+    """Stop a pending setup and close an agent created by start_agent()."""
+    if not setup_task.done():
+        setup_task.cancel()
+    # Wait for the setup task so it is never left pending or unretrieved
+    await asyncio.gather(setup_task, return_exceptions=True)
+    await agent.aclose()
+
+async def process_requests(queries, started_agent=None):
+    """
+    Process several natural language requests with a single SoM Agent.
+    
+    The agent is set up once and shared by all requests. The requests run
+    one after another in this task, because the MCP connections the agent
+    opens have to be closed by the same task that opened them. Pass
+    started_agent (from start_agent()) to reuse an agent whose setup is
+    already under way; the caller is then responsible for closing it.
+    """
+    owns_agent = started_agent is None
+    agent, setup_task = started_agent or start_agent()
     
     try:
-        logger.info(f"Processing request: {query}")
-        
-        # Process the natural language request
-        result = await agent.process_request(query)
-        
-        # Check if the request was successful
-        if result.get("status") == "success":
-            logger.info(f"Request successful!")
-            logger.info(f"Capability used: {result.get('capability')}")
-            logger.info(f"Tool used: {result.get('tool_name')}")
-            
-            # Print the result
-            print("\n--- Result ---")
-            print_result(result.get("result"))
-            
-            return result.get("result")
-        else:
-            # Handle errors
-            logger.error(f"Request failed: {result.get('error')}")
-            logger.error(f"Error type: {result.get('error_type')}")
-            
-            # Print suggestions
-            print("\n--- Error Information ---")
-            print(f"Error: {result.get('error')}")
-            print(f"Type: {result.get('error_type')}")
-            print(f"Suggestion: {result.get('suggestion')}")
-            
-            if result.get("missing_api_key"):
-                print(f"\nMissing API key: {result.get('missing_api_key')}")
-                print("Set this environment variable to fix the issue.")
-            
-            return None
+        # Only wait for the setup when the agent is actually needed
+        await setup_task
+        return [await handle_request(agent, query) for query in queries]
     finally:
         # Always clean up resources
-        await agent.aclose()
+        if owns_agent:
+            await close_agent(agent, setup_task)
+
+def format_result(result):
+    """Format a result for display based on its type."""
+    if isinstance(result, dict):
+        return "\n".join(f"{key}: {value}" for key, value in result.items())
+    if isinstance(result, list):
+        return "\n".join(f"{i}. {item}" for i, item in enumerate(result, 1))
+    return str(result)
 
 def print_result(result):
     """Pretty print the result based on its type."""
-    if isinstance(result, dict):
-        for key, value in result.items():
-            print(f"{key}: {value}")
-    elif isinstance(result, list):
-        for i, item in enumerate(result, 1):
-            print(f"{i}. {item}")
+    print(format_result(result))
+
+async def ainput(prompt):
+    """
+    Read a line of input without blocking the event loop.
+    
+    On POSIX terminals stdin is watched with loop.add_reader, so Ctrl+C
+    exits straight away instead of waiting for the default executor to
+    finish a thread stuck in input(). Elsewhere (Windows event loops can't
+    watch stdin, and piped input isn't line-buffered) the read falls back
+    to a daemon thread; a read abandoned that way stays blocked on stdin
+    until the process exits.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value):
+        # The prompt may have been cancelled while waiting for input
+        if not future.done():
+            setter(value)
+    
+    def read_ready():
+        line = sys.stdin.readline()
+        if line:
+            deliver(future.set_result, line.rstrip("\n"))
+        else:
+            deliver(future.set_exception, EOFError())
+    
+    def read_line():
+        try:
+            result = (future.set_result, input())
+        except Exception as e:
+            result = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(deliver, *result)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+    
+    print(prompt, end="", flush=True)
+    try:
+        if not sys.stdin.isatty():
+            raise NotImplementedError
+        loop.add_reader(sys.stdin.fileno(), read_ready)
+    except NotImplementedError:
+        threading.Thread(target=read_line, daemon=True).start()
     else:
-        print(result)
+        future.add_done_callback(lambda _: loop.remove_reader(sys.stdin.fileno()))
+    return await future
 
 async def main():
     """Run the example with different capability requests."""
     print("\n===== State of Mika SDK Example =====\n")
     
-    # List of example requests to demonstrate different capabilities
-    example_requests = [
-        "What's the weather like in Tokyo today?",
-        "Search for the latest news about artificial intelligence",
-        "What time is it in New York?",
-        "Solve the equation x^2 + 2x - 3 = 0"
-    ]
-    
-    # Allow the user to choose an example or enter their own
-    print("Example requests:")
-    for i, req in enumerate(example_requests, 1):
-        print(f"{i}. {req}")
-    print("5. Enter your own request")
-    
-    choice = input("\nEnter your choice (1-5): ")
+    # Start setting up the agent while the user picks a request
+    agent, setup_task = started_agent = start_agent()
     
     try:
-        choice_num = int(choice)
-        if 1 <= choice_num <= 4:
-            request = example_requests[choice_num - 1]
-        elif choice_num == 5:
-            request = input("\nEnter your request: ")
-        else:
-            print("Invalid choice. Using the first example.")
-            request = example_requests[0]
-    except ValueError:
-        print("Invalid input. Using the first example.")
-        request = example_requests[0]
-    
-    print(f"\nProcessing request: '{request}'")
-    await process_request(request)
+        # Allow the user to choose an example or enter their own
+        print("Example requests:")
+        for i, req in enumerate(EXAMPLE_REQUESTS, 1):
+            print(f"{i}. {req}")
+        print("5. Enter your own request")
+        
+        choice = await ainput("\nEnter your choice (1-5, comma-separated for several): ")
+        
+        requests = []
+        for part in choice.split(","):
+            try:
+                choice_num = int(part)
+            except ValueError:
+                print(f"Invalid input '{part.strip()}'. Skipping.")
+                continue
+            if 1 <= choice_num <= 4:
+                requests.append(EXAMPLE_REQUESTS[choice_num - 1])
+            elif choice_num == 5:
+                requests.append(await ainput("\nEnter your request: "))
+            else:
+                print(f"Invalid choice {choice_num}. Skipping.")
+        
+        if not requests:
+            print("No valid choices. Using the first example.")
+            requests = [EXAMPLE_REQUESTS[0]]
+        
+        for request in requests:
+            print(f"\nProcessing request: '{request}'")
+        await process_requests(requests, started_agent=started_agent)
+    finally:
+        # Close the agent even if reading the input failed or was interrupted
+        await close_agent(agent, setup_task)
     
     print("\n===== Example Complete =====")
 
+async def run():
+    """Run the example on an already running event loop."""
+    await main()
+
 if __name__ == "__main__":
     # Check if Anthropic API key is set
     if not os.environ.get("ANTHROPIC_API_KEY"):
@@ -121,5 +227,12 @@ if __name__ == "__main__":
         print("Get an API key from: https://www.anthropic.com/product")
         print("Then set it with: export ANTHROPIC_API_KEY='your_key_here'")
     
-    # Run the async main function
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop is None:
+        asyncio.run(main())
+    else:
+        uvloop.run(main()) 
\ No newline at end of file
@@ -5,11 +5,22 @@ Script to import MCP servers from mcp-servers.md to servers.json
 
 import re
 import json
+import mmap
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 import logging
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Set file paths
@@ -40,21 +51,112 @@ OS_EMOJI_MAP = {
     "🪟": "windows"
 }
 
-def parse_section(content: str, section_name: str) -> List[str]:
-    """Extract a specific section from the markdown content"""
-    section_pattern = fr"###\s+.*?{section_name}.*?\n(.*?)(?=###|\Z)"
-    match = re.search(section_pattern, content, re.DOTALL | re.IGNORECASE)
+# Marks official servers
+OFFICIAL_EMOJI = "🎖️"
+
+# Emoji presentation selector, which is written inconsistently in the markdown
+VARIATION_SELECTOR = "\ufe0f"
+
+def _build_emoji_field_map() -> Dict[str, Tuple[str, Any, int]]:
+    """Fuse the emoji maps into one {emoji: (field, value, rank)} lookup table
     
-    if not match:
-        logging.warning(f"Section {section_name} not found in the content")
-        return []
-        
-    section_content = match.group(1).strip()
-    lines = section_content.split('\n')
-    # Filter out lines that are not server entries (they should start with -)
-    return [line for line in lines if line.strip().startswith('-')]
+    The rank is the emoji's position in its own map; when several emojis for the
+    same field appear, the one listed first in the map wins.
+    """
+    field_map = {OFFICIAL_EMOJI.replace(VARIATION_SELECTOR, ''): ("is_official", True, 0)}
+    for field, emoji_map in (("language", LANGUAGE_EMOJI_MAP),
+                             ("scope", SCOPE_EMOJI_MAP),
+                             ("os", OS_EMOJI_MAP)):
+        for rank, (emoji, value) in enumerate(emoji_map.items()):
+            field_map[emoji.replace(VARIATION_SELECTOR, '')] = (field, value, rank)
+    return field_map
+
+EMOJI_FIELD_MAP = _build_emoji_field_map()
+
+# Matches every attribute emoji in one scan, longest first
+EMOJI_PATTERN = re.compile('|'.join(
+    re.escape(emoji) for emoji in sorted(EMOJI_FIELD_MAP, key=len, reverse=True)
+))
+
+# Splits markdown into sections at each "### " heading
+SECTION_SPLIT_PATTERN = re.compile(r'(?m)^###\s+')
+SECTION_SPLIT_BYTES_PATTERN = re.compile(rb'(?m)^###\s+')
+
+# Regular expression to capture server entries
+SERVER_PATTERN = re.compile(r'- \[(?P<name>.*?)\]\((?P<url>.*?)\)(?P<attributes>.*?) - (?P<description>.*)')
+
+# Regular expressions used by sanitize_name
+NON_WORD_PATTERN = re.compile(r'[^\w\s-]')
+SEPARATOR_PATTERN = re.compile(r'[\s-]+')
 
-def extract_servers_from_markdown(md_content: str) -> List[Dict[str, Any]]:
+def _build_name_translation() -> Dict[int, Optional[str]]:
+    """Translation table for ASCII names: drop punctuation, turn separators into spaces"""
+    table = {}
+    for c in map(chr, range(128)):
+        if SEPARATOR_PATTERN.match(c):
+            table[c] = ' '
+        elif NON_WORD_PATTERN.match(c):
+            table[c] = None
+    return str.maketrans(table)
+
+NAME_TRANSLATION = _build_name_translation()
+
+# Splits descriptions into words
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Map categories to capability keywords
+CATEGORY_CAPABILITIES = {
+    "Browser Automation": ("browser", "web", "automation"),
+    "Databases": ("database", "query", "sql"),
+    "File Systems": ("file", "filesystem", "storage"),
+    "Search": ("search", "information", "retrieval"),
+    "Weather": ("weather", "forecast", "temperature")
+}
+
+# Words never used as capabilities
+COMMON_WORDS = frozenset({"the", "a", "an", "and", "or", "for", "with", "that", "this", "to", "in", "on", "at", "by", "from"})
+
+MAX_CAPABILITIES = 5
+
+def parse_sections(content: Union[str, bytes, mmap.mmap], section_names: List[str]) -> Dict[str, List[str]]:
+    """Extract the server entries of several sections in a single pass over the markdown
+    
+    The content may be a str, or UTF-8 bytes / a memory-mapped file, in which case
+    only the headings and the requested sections are decoded.
+    """
+    sections: Dict[str, List[str]] = {}
+    lowered_names = [(name, name.lower()) for name in section_names]
+    
+    if isinstance(content, str):
+        pattern, newline = SECTION_SPLIT_PATTERN, '\n'
+        decode = str
+    else:
+        pattern, newline = SECTION_SPLIT_BYTES_PATTERN, b'\n'
+        decode = lambda data: data.decode('utf-8')
+    
+    headings = list(pattern.finditer(content))
+    for i, heading_match in enumerate(headings):
+        start = heading_match.end()
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
+        heading_end = content.find(newline, start, end)
+        if heading_end == -1:
+            heading_end = end
+        heading = decode(content[start:heading_end]).lower()
+        for name, lowered_name in lowered_names:
+            # Use the first heading that mentions each section name
+            if name not in sections and lowered_name in heading:
+                body = decode(content[heading_end + 1:end])
+                # Filter out lines that are not server entries (they should start with -)
+                sections[name] = [line for line in body.strip().split('\n') if line.strip().startswith('-')]
+                break
+    
+    for name in section_names:
+        if name not in sections:
+            logging.warning(f"Section {name} not found in the content")
+            
+    return sections
+
+def extract_servers_from_markdown(md_content: Union[str, bytes, mmap.mmap]) -> List[Dict[str, Any]]:
     """Extract server information from markdown content"""
     
     servers = []
@@ -69,26 +171,22 @@ def extract_servers_from_markdown(md_content: str) -> List[Dict[str, Any]]:
     ]
     
     # Gather all server entries
+    sections = parse_sections(md_content, categories)
     server_entries = []
     for category in categories:
-        entries = parse_section(md_content, category)
-        for entry in entries:
+        for entry in sections.get(category, []):
             server_entries.append((entry, category))
             
-    # Regular expression to capture server entries
-    server_pattern = r'- \[(.*?)\]\((.*?)\)(.*?) - (.*)'
-    
     # Process each server entry
     for entry, category in server_entries:
-        match = re.match(server_pattern, entry)
+        match = SERVER_PATTERN.match(entry)
         if not match:
             logging.warning(f"Failed to parse server entry: {entry}")
             continue
             
-        name = match.group(1).strip()
-        url = match.group(2).strip()
-        attributes = match.group(3).strip()
-        description = match.group(4).strip()
+        name, url, attributes, description = (
+            group.strip() for group in match.group("name", "url", "attributes", "description")
+        )
         
         # Skip entries that aren't actual servers
         if "awesome-mcp" in url or "framework" in name.lower() or "utility" in name.lower():
@@ -102,11 +200,16 @@ def extract_servers_from_markdown(md_content: str) -> List[Dict[str, Any]]:
         capabilities = extract_capabilities(description, category)
         
         # Extract attributes
-        is_official = "🎖️" in attributes
-        language = next((LANGUAGE_EMOJI_MAP[emoji] for emoji in LANGUAGE_EMOJI_MAP if emoji in attributes), None)
-        scope = next((SCOPE_EMOJI_MAP[emoji] for emoji in SCOPE_EMOJI_MAP if emoji in attributes), None)
-        os_type = next((OS_EMOJI_MAP[emoji] for emoji in OS_EMOJI_MAP if emoji in attributes), None)
+        fields = classify_attributes(attributes)
+        is_official = fields.get("is_official", False)
+        language = fields.get("language")
+        scope = fields.get("scope")
+        os_type = fields.get("os")
+        
+        # Add installation and launch info based on language
+        install_info = create_install_info(language, repo, name) if language else None
         
+        # Build the entry with every key up front so the dict is sized once
         server_info = {
             "name": sanitize_name(name),
             "description": description,
@@ -117,16 +220,15 @@ def extract_servers_from_markdown(md_content: str) -> List[Dict[str, Any]]:
             "language": language,
             "scope": scope,
             "category": category,
+            "os": os_type,
+            "install": install_info,
         }
         
-        if os_type:
-            server_info["os"] = os_type
-            
-        # Add installation and launch info based on language
-        if language:
-            install_info = create_install_info(language, repo, name)
-            if install_info:
-                server_info["install"] = install_info
+        # Drop the optional fields that don't apply
+        if not os_type:
+            del server_info["os"]
+        if not install_info:
+            del server_info["install"]
                 
         servers.append(server_info)
         
@@ -137,16 +239,33 @@ def extract_servers_from_markdown(md_content: str) -> List[Dict[str, Any]]:
     
     return servers
 
+def classify_attributes(attributes: str) -> Dict[str, Any]:
+    """Map the emoji attributes of a server entry to their fields in one scan"""
+    fields: Dict[str, Any] = {}
+    ranks: Dict[str, int] = {}
+    for match in EMOJI_PATTERN.finditer(attributes.replace(VARIATION_SELECTOR, '')):
+        field, value, rank = EMOJI_FIELD_MAP[match.group()]
+        # Keep the value whose emoji comes first in its map, not first in the text
+        if field not in ranks or rank < ranks[field]:
+            ranks[field] = rank
+            fields[field] = value
+    return fields
+
 def sanitize_name(name: str) -> str:
     """Sanitize server name"""
     # Remove @username/ prefix if present
-    if '/' in name:
-        name = name.split('/')[-1]
+    name = name.rsplit('/', 1)[-1].lower()
     
     # Remove special characters and convert to snake_case
-    name = name.lower()
-    name = re.sub(r'[^\w\s-]', '', name)
-    name = re.sub(r'[\s-]+', '_', name)
+    if name.isascii():
+        name = name.translate(NAME_TRANSLATION)
+        while '  ' in name:
+            name = name.replace('  ', ' ')
+        name = name.replace(' ', '_')
+    else:
+        # Unicode word characters need the regex definition of \w
+        name = NON_WORD_PATTERN.sub('', name)
+        name = SEPARATOR_PATTERN.sub('_', name)
     
     # Ensure it starts with mcp_ if not already
     if not name.startswith('mcp_'):
@@ -156,31 +275,19 @@ def sanitize_name(name: str) -> str:
 
 def extract_capabilities(description: str, category: str) -> List[str]:
     """Extract capabilities from description and category"""
-    # Add the category as a capability
-    capabilities = []
-    
-    # Map categories to capability keywords
-    category_map = {
-        "Browser Automation": ["browser", "web", "automation"],
-        "Databases": ["database", "query", "sql"],
-        "File Systems": ["file", "filesystem", "storage"],
-        "Search": ["search", "information", "retrieval"],
-        "Weather": ["weather", "forecast", "temperature"]
-    }
-    
-    # Add category-based capabilities
-    if category in category_map:
-        capabilities.extend(category_map[category])
+    # Start from the category-based capabilities
+    capabilities = list(CATEGORY_CAPABILITIES.get(category, ()))
+    seen = set(capabilities)
     
-    # Extract key words from description
-    words = re.findall(r'\b\w+\b', description.lower())
+    # Add key words from the description in order, up to 5 capabilities in total
+    for word in WORD_PATTERN.findall(description.lower()):
+        if len(capabilities) >= MAX_CAPABILITIES:
+            break
+        if len(word) > 3 and word not in COMMON_WORDS and word not in seen:
+            capabilities.append(word)
+            seen.add(word)
     
-    # Filter out common words
-    common_words = {"the", "a", "an", "and", "or", "for", "with", "that", "this", "to", "in", "on", "at", "by", "from"}
-    capabilities.extend([word for word in words if len(word) > 3 and word not in common_words and word not in capabilities])
-    
-    # Limit to top 5 most relevant capabilities
-    return list(set(capabilities))[:5]
+    return capabilities[:MAX_CAPABILITIES]
 
 def create_install_info(language: str, repo: Optional[str], name: str) -> Dict[str, Any]:
     """Create installation information based on language"""
@@ -226,24 +333,34 @@ def main():
     current_servers = []
     if JSON_FILE.exists():
         try:
-            with open(JSON_FILE, 'r') as f:
-                data = json.load(f)
-                current_servers = data.get("servers", [])
+            with open(JSON_FILE, 'rb') as f:
+                if ijson is not None:
+                    # Stream only the servers array instead of loading the whole document
+                    current_servers = list(ijson.items(f, 'servers.item', use_float=True))
+                else:
+                    current_servers = json.load(f).get("servers", [])
                 logging.info(f"Loaded {len(current_servers)} servers from existing servers.json")
         except Exception as e:
             logging.error(f"Error reading servers.json: {e}")
             
-    # Read markdown file
+    # Map the markdown file rather than reading it into memory (empty files can't be mapped)
     try:
-        with open(MD_FILE, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        with open(MD_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                md_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                md_content = b''
             logging.info(f"Successfully read markdown file: {MD_FILE}")
     except Exception as e:
         logging.error(f"Error reading markdown file: {e}")
         return
         
     # Extract servers from markdown
-    new_servers = extract_servers_from_markdown(md_content)
+    try:
+        new_servers = extract_servers_from_markdown(md_content)
+    finally:
+        if isinstance(md_content, mmap.mmap):
+            md_content.close()
     logging.info(f"Extracted {len(new_servers)} servers from markdown")
     
     # Merge with existing servers, preferring existing configurations
@@ -274,9 +391,11 @@ def main():
             merged_servers.append(server_to_add)
     
     # Add existing servers that weren't in the new servers list
+    merged_names = {s["name"] for s in merged_servers}
     for name, server in existing_servers_map.items():
-        if name not in [s["name"] for s in merged_servers]:
+        if name not in merged_names:
             merged_servers.append(server)
+            merged_names.add(name)
     
     # Sort servers: official first, then alphabetically
     merged_servers.sort(key=lambda x: (not x.get("is_official", False), x.get("name", "")))
@@ -291,9 +410,13 @@ def main():
     
     # Write output to new file
     try:
-        with open(OUTPUT_JSON_FILE, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
-            logging.info(f"Successfully wrote {len(merged_servers)} servers to {OUTPUT_JSON_FILE}")
+        if orjson is not None:
+            with open(OUTPUT_JSON_FILE, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(OUTPUT_JSON_FILE, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2)
+        logging.info(f"Successfully wrote {len(merged_servers)} servers to {OUTPUT_JSON_FILE}")
     except Exception as e:
         logging.error(f"Error writing output file: {e}")
         return
@@ -301,8 +424,14 @@ def main():
     logging.info(f"Process completed successfully. Please review {OUTPUT_JSON_FILE} before replacing servers.json")
     
     # Generate a summary of changes
-    added_servers = [s["name"] for s in merged_servers if s["name"] not in [existing["name"] for existing in current_servers]]
-    updated_servers = [s["name"] for s in merged_servers if s["name"] in [existing["name"] for existing in current_servers] and s != existing_servers_map.get(s["name"])]
+    added_servers = []
+    updated_servers = []
+    for server in merged_servers:
+        name = server["name"]
+        if name not in existing_servers_map:
+            added_servers.append(name)
+        elif server != existing_servers_map[name]:
+            updated_servers.append(name)
     
     if added_servers:
         logging.info(f"Added {len(added_servers)} new servers: {', '.join(added_servers)}")
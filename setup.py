@@ -78,6 +78,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "dev": dev_requirements,
+        "speedups": ["orjson>=3.6.0"],
     },
     dependency_links=dependency_links,
     entry_points={
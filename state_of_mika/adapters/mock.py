@@ -54,7 +54,7 @@ class MockMessages:
         Returns:
             A mock message response
         """
-        logger.debug(f"MockMessages.create called with model: {model}")
+        logger.debug("MockMessages.create called with model: %s", model)
         
         # Extract the user message
         user_message = None
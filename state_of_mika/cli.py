@@ -18,6 +18,13 @@ from state_of_mika.registry import Registry
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging with the appropriate level."""
     level = logging.DEBUG if verbose else logging.INFO
+    root_logger = logging.getLogger()
+    
+    # Importing the package may already have configured a handler; only adjust the level then
+    if root_logger.handlers:
+        root_logger.setLevel(level)
+        return
+        
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -27,88 +34,100 @@ def setup_logging(verbose: bool = False) -> None:
 async def list_servers(args: argparse.Namespace) -> None:
     """List available servers."""
     registry = Registry()
-    await registry.update()
-    
-    if args.all:
-        servers = registry.get_all_servers()
-    else:
-        servers = registry.get_installed_servers()
-        
-    if not servers:
-        print("No servers available.")
-        return
+    try:
+        await registry.update()
         
-    print(f"Found {len(servers)} server(s):")
-    for server in servers:
-        installed = "INSTALLED" if registry.is_server_installed(server["name"]) else "NOT INSTALLED"
-        print(f"  - {server['name']} (v{server['version']}) [{installed}]")
-        print(f"    Description: {server['description']}")
-        print(f"    Capabilities: {', '.join(server['capabilities'])}")
-        print("")
+        if args.all:
+            servers = registry.get_all_servers()
+        else:
+            servers = registry.get_installed_servers()
+            
+        if not servers:
+            print("No servers available.")
+            return
+            
+        print(f"Found {len(servers)} server(s):")
+        for server in servers:
+            installed = "INSTALLED" if registry.is_server_installed(server["name"]) else "NOT INSTALLED"
+            print(f"  - {server['name']} (v{server['version']}) [{installed}]")
+            print(f"    Description: {server['description']}")
+            print(f"    Capabilities: {', '.join(server['capabilities'])}")
+            print("")
+    finally:
+        await registry.aclose()
 
 
 async def search_servers(args: argparse.Namespace) -> None:
     """Search for servers by query."""
     registry = Registry()
-    await registry.update()
-    
-    servers = registry.search_by_capability(args.query)
-    
-    if not servers:
-        print(f"No servers found matching '{args.query}'.")
-        return
+    try:
+        await registry.update()
+        
+        servers = registry.search_by_capability(args.query)
         
-    print(f"Found {len(servers)} server(s) matching '{args.query}':")
-    for server in servers:
-        installed = "INSTALLED" if registry.is_server_installed(server["name"]) else "NOT INSTALLED"
-        print(f"  - {server['name']} (v{server['version']}) [{installed}]")
-        print(f"    Description: {server['description']}")
-        print(f"    Capabilities: {', '.join(server['capabilities'])}")
-        print("")
+        if not servers:
+            print(f"No servers found matching '{args.query}'.")
+            return
+            
+        print(f"Found {len(servers)} server(s) matching '{args.query}':")
+        for server in servers:
+            installed = "INSTALLED" if registry.is_server_installed(server["name"]) else "NOT INSTALLED"
+            print(f"  - {server['name']} (v{server['version']}) [{installed}]")
+            print(f"    Description: {server['description']}")
+            print(f"    Capabilities: {', '.join(server['capabilities'])}")
+            print("")
+    finally:
+        await registry.aclose()
 
 
 async def install_server(args: argparse.Namespace) -> None:
     """Install a server by name."""
     registry = Registry()
-    await registry.update()
-    
-    server = registry.get_server_by_name(args.name)
-    if not server:
-        print(f"Server '{args.name}' not found in registry.")
-        return
-        
-    installer = Installer(registry)
     try:
-        print(f"Installing {server['name']}...")
-        installed = await installer.install_server(server["name"])
-        if installed:
-            print(f"Successfully installed {server['name']}.")
-        else:
-            print(f"Failed to install {server['name']}.")
-    except Exception as e:
-        print(f"Error installing {server['name']}: {str(e)}")
+        await registry.update()
+        
+        server = registry.get_server_by_name(args.name)
+        if not server:
+            print(f"Server '{args.name}' not found in registry.")
+            return
+            
+        installer = Installer(registry)
+        try:
+            print(f"Installing {server['name']}...")
+            installed = await installer.install_server(server["name"])
+            if installed:
+                print(f"Successfully installed {server['name']}.")
+            else:
+                print(f"Failed to install {server['name']}.")
+        except Exception as e:
+            print(f"Error installing {server['name']}: {str(e)}")
+    finally:
+        await registry.aclose()
 
 
 async def uninstall_server(args: argparse.Namespace) -> None:
     """Uninstall a server by name."""
     registry = Registry()
-    await registry.update()
-    
-    server = registry.get_server_by_name(args.name)
-    if not server:
-        print(f"Server '{args.name}' not found in registry.")
-        return
-        
-    installer = Installer(registry)
     try:
-        print(f"Uninstalling {server['name']}...")
-        uninstalled = await installer.uninstall_server(server["name"])
-        if uninstalled:
-            print(f"Successfully uninstalled {server['name']}.")
-        else:
-            print(f"Failed to uninstall {server['name']}.")
-    except Exception as e:
-        print(f"Error uninstalling {server['name']}: {str(e)}")
+        await registry.update()
+        
+        server = registry.get_server_by_name(args.name)
+        if not server:
+            print(f"Server '{args.name}' not found in registry.")
+            return
+            
+        installer = Installer(registry)
+        try:
+            print(f"Uninstalling {server['name']}...")
+            uninstalled = await installer.uninstall_server(server["name"])
+            if uninstalled:
+                print(f"Successfully uninstalled {server['name']}.")
+            else:
+                print(f"Failed to uninstall {server['name']}.")
+        except Exception as e:
+            print(f"Error uninstalling {server['name']}: {str(e)}")
+    finally:
+        await registry.aclose()
 
 
 async def update_registry(args: argparse.Namespace) -> None:
@@ -123,6 +142,8 @@ async def update_registry(args: argparse.Namespace) -> None:
             print("Server registry is already up to date.")
     except Exception as e:
         print(f"Error updating server registry: {str(e)}")
+    finally:
+        await registry.aclose()
 
 
 def main() -> None:
@@ -123,14 +123,14 @@ class Connector:
                 return server_name, self.connections[server_name]
             
             # Check if server is installed
-            if not self.registry.is_server_installed(server_name):
+            if not await self.registry.is_server_installed_async(server_name):
                 # Check if auto-install is enabled - support both environment variable and class attribute
                 auto_install = (
                     os.environ.get("AUTO_INSTALL_SERVERS", "").lower() == "true" or 
                     getattr(self, "auto_install", False)
                 )
                 
-                logger.debug(f"Auto-install for servers is: {auto_install}")
+                logger.debug("Auto-install for servers is: %s", auto_install)
                 
                 if auto_install:
                     logger.info(f"Auto-installing server for capability: {capability}")
@@ -168,6 +168,8 @@ class Connector:
             ValueError: If the server is not found in the registry
             RuntimeError: If the server cannot be launched
         """
+        # Connections are keyed by the registry's spelling of the name
+        server_name = self._canonical_server_name(server_name)
         if server_name in self.connections:
             logger.info(f"Already connected to server: {server_name}")
             return self.connections[server_name]
@@ -178,7 +180,7 @@ class Connector:
             raise ValueError(f"Server '{server_name}' not found in registry")
         
         # Check if server is installed
-        if not self.registry.is_server_installed(server_name):
+        if not await self.registry.is_server_installed_async(server_name):
             # Check if auto-install is enabled
             auto_install = (
                 os.environ.get("AUTO_INSTALL_SERVERS", "").lower() == "true" or 
@@ -324,9 +326,10 @@ class Connector:
                             )
                             stdout, stderr = await pip_process.communicate()
                             
-                            # Log the output for debugging
-                            logger.debug(f"Pip install output: {stdout.decode()}")
-                            logger.debug(f"Pip install errors: {stderr.decode()}")
+                            # Log the output for debugging (decoding verbose pip output is only worth it at DEBUG)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Pip install output: %s", stdout.decode())
+                                logger.debug("Pip install errors: %s", stderr.decode())
                             
                             # Now try launching the server again
                             logger.info(f"Attempting to launch {server_name} after reinstalling")
@@ -429,6 +432,22 @@ class Connector:
             # Unknown server type, try a simple command
             return server_name, [], env
     
+    def _canonical_server_name(self, server_name: str) -> str:
+        """
+        Get the registry's spelling of a server name.
+        
+        Args:
+            server_name: Server name in any casing
+            
+        Returns:
+            The name as stored in the registry, or the given name if the
+            server isn't in the registry
+        """
+        server_data = self.registry.get_server_by_name(server_name)
+        if server_data:
+            return server_data.get("name", server_name)
+        return server_name
+    
     async def disconnect(self, server_name: str) -> bool:
         """
         Disconnect from a server.
@@ -439,6 +458,7 @@ class Connector:
         Returns:
             True if disconnected successfully, False otherwise
         """
+        server_name = self._canonical_server_name(server_name)
         if server_name not in self.connections:
             logger.warning(f"Not connected to server: {server_name}")
             return False
@@ -562,7 +582,7 @@ class Connector:
         logger.info(f"✓ Selected server '{server_name}' for capability '{capability}'")
         
         # Check if server is installed
-        if not self.registry.is_server_installed(server_name):
+        if not await self.registry.is_server_installed_async(server_name):
             # Check if auto-install is enabled - support both environment variable and class attribute
             auto_install = (
                 os.environ.get("AUTO_INSTALL_SERVERS", "").lower() == "true" or 
@@ -681,7 +701,7 @@ class Connector:
             installed_servers = []
             for server in matching_servers:
                 server_name = server.get("name")
-                if self.registry.is_server_installed(server_name):
+                if await self.registry.is_server_installed_async(server_name):
                     installed_servers.append(server)
             
             if not installed_servers:
@@ -694,7 +714,7 @@ class Connector:
                     getattr(self, "auto_install", False)
                 )
                 
-                logger.debug(f"Auto-install for servers is: {auto_install}")
+                logger.debug("Auto-install for servers is: %s", auto_install)
                 
                 suggestion = f"Consider installing a server for the '{capability}' capability."
                 if not auto_install and available_servers:
@@ -769,14 +789,15 @@ class Connector:
         # Get server name
         if isinstance(server_data, str):
             server_name = server_data
-            if server_name not in self.registry.servers:
+            server_data = self.registry.get_server_by_name(server_name)
+            if not server_data:
                 logger.error(f"No such server: {server_name}")
                 return {
                     "error": f"Server {server_name} not found in registry",
                     "status": "error",
                     "suggestion": "Check server name or update registry"
                 }
-            server_data = self.registry.servers[server_name]
+            server_name = server_data.get("name", server_name)
         else:
             server_name = server_data.get("name")
             if not server_name:
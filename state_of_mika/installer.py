@@ -11,11 +11,29 @@ import sys
 import json
 import logging
 import asyncio
+import functools
+import shutil
 import subprocess
 from typing import Dict, List, Any, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _tool_available(name: str) -> bool:
+    """
+    Check whether a command-line tool is on the PATH
+    
+    The result is cached for the lifetime of the process, so installers don't
+    spawn a `--version` probe for every installation.
+    
+    Args:
+        name: Name of the executable
+        
+    Returns:
+        True if the tool can be found, False otherwise
+    """
+    return shutil.which(name) is not None
+
 class Installer:
     """
     Installer for MCP servers
@@ -31,6 +49,8 @@ class Installer:
         Args:
             registry: Registry instance (will be imported if None)
         """
+        # Only a registry created here is closed by aclose()
+        self._owns_registry = registry is None
         if registry is None:
             # Import here to avoid circular imports
             from .registry import Registry
@@ -38,6 +58,11 @@ class Installer:
         else:
             self.registry = registry
             
+    async def aclose(self) -> None:
+        """Close the registry's HTTP session if the registry was created by this installer."""
+        if self._owns_registry:
+            await self.registry.aclose()
+            
     async def install_server(self, server_data: Union[str, Dict[str, Any]]) -> bool:
         """
         Install an MCP server
@@ -70,7 +95,7 @@ class Installer:
         logger.info(f"⚙️ Starting installation process for '{server_name}'")
             
         # Skip if already installed
-        if self.registry.is_server_installed(server_name):
+        if await self.registry.is_server_installed_async(server_name):
             logger.info(f"✅ Server '{server_name}' is already installed")
             return True
             
@@ -101,6 +126,36 @@ class Installer:
             logger.error(f"❌ Unsupported installation type: {install_type}")
             return False
             
+    async def install_servers(self, servers: List[Union[str, Dict[str, Any]]],
+                              concurrency: int = 4) -> Dict[str, bool]:
+        """
+        Install several MCP servers concurrently
+        
+        Args:
+            servers: Server names or server data dictionaries to install
+            concurrency: Maximum number of installations running at once
+        
+        Returns:
+            Dictionary mapping each server name to whether it was installed
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def install_one(server_data: Union[str, Dict[str, Any]]) -> bool:
+            async with semaphore:
+                return await self.install_server(server_data)
+        
+        results = await asyncio.gather(*(install_one(server) for server in servers), return_exceptions=True)
+        
+        installed = {}
+        for server, result in zip(servers, results):
+            server_name = server if isinstance(server, str) else server.get("name")
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Error installing server '{server_name}': {result}")
+                result = False
+            installed[server_name] = result
+        
+        return installed
+            
     async def _install_pip(self, server_name: str, install_info: Dict[str, Any]) -> bool:
         """
         Install an MCP server via pip
@@ -140,14 +195,7 @@ class Installer:
         
         # Try uv first if available (faster installs)
         try:
-            check_process = await asyncio.create_subprocess_exec(
-                "uv", "--version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await check_process.communicate()
-            
-            if check_process.returncode == 0:
+            if _tool_available("uv"):
                 logger.info(f"🚀 Installing package with uv: {package}")
                 
                 # uv install command
@@ -216,19 +264,8 @@ class Installer:
             package = f"{package}@{version}"
         
         # Check if npm is installed
-        try:
-            check_process = await asyncio.create_subprocess_exec(
-                "npm", "--version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await check_process.communicate()
-            
-            if check_process.returncode != 0:
-                logger.error("npm is not installed or not in the PATH")
-                return False
-        except Exception as e:
-            logger.error(f"Error checking npm installation: {e}")
+        if not _tool_available("npm"):
+            logger.error("npm is not installed or not in the PATH")
             return False
             
         # For npm packages, check if the package should be installed globally
@@ -511,19 +548,8 @@ class Installer:
                     package = f"{package}@{version}"
                 
                 # Check if npm is installed
-                try:
-                    check_process = await asyncio.create_subprocess_exec(
-                        "npm", "--version",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    stdout, stderr = await check_process.communicate()
-                    
-                    if check_process.returncode != 0:
-                        logger.error("npm is not installed or not in the PATH")
-                        return False
-                except Exception as e:
-                    logger.error(f"Error checking npm installation: {e}")
+                if not _tool_available("npm"):
+                    logger.error("npm is not installed or not in the PATH")
                     return False
                     
                 # For npm packages, check if the package should be installed globally
@@ -822,7 +848,7 @@ class Installer:
             await self.registry.load()
             
         for server_name in self.registry.servers:
-            if self.registry.is_server_installed(server_name):
+            if await self.registry.is_server_installed_async(server_name):
                 installed_servers.append(server_name)
                 
         return installed_servers 
\ No newline at end of file
@@ -237,7 +237,7 @@ class MikaAdapter:
                     return result
                 except (json.JSONDecodeError, ValueError) as e:
                     logger.error(f"Error parsing Claude response: {e}")
-                    logger.debug(f"Claude response: {response_text}")
+                    logger.debug("Claude response: %s", response_text)
                     return {
                         "error": f"Failed to parse response from Claude: {str(e)}",
                         "suggestion": "The AI returned an invalid format. Try rephrasing your request."
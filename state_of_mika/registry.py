@@ -9,20 +9,127 @@ This module provides improved functionality to:
 5. Provide metadata about available servers
 """
 
+import asyncio
+import copy
+import functools
 import json
 import logging
 import os
 import re
-import aiohttp
-import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Tuple, Set
 from difflib import SequenceMatcher
 from collections import defaultdict
 
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Registry bundled with the package
+DEFAULT_REGISTRY_FILE = Path(__file__).parent / 'registry' / 'servers.json'
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON with orjson when it is installed, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _servers_from_data(data: Any) -> List[Dict[str, Any]]:
+    """
+    Extract the list of server entries from parsed registry data.
+    
+    Args:
+        data: Parsed registry JSON, either the categorized dict format or a plain list
+        
+    Returns:
+        List of server entries, with frameworks and utilities tagged by section
+    """
+    # The new format might have server entries in different places
+    # 1. Check for the new format with categorized sections
+    if isinstance(data, dict):
+        # Extract servers array
+        servers_list = data.get('servers', [])
+        
+        # Also check if there are frameworks and utilities lists
+        for section in ['frameworks', 'utilities']:
+            if section in data:
+                # Add a section identifier to each item in these lists
+                for item in data[section]:
+                    item['_section'] = section
+                servers_list.extend(data[section])
+        return servers_list
+        
+    # 2. Check for the old format (just an array of servers)
+    if isinstance(data, list):
+        return data
+        
+    return []
+
+@functools.lru_cache(maxsize=None)
+def _ensure_directory(path: str) -> None:
+    """
+    Create a directory if needed, once per process and path.
+    
+    Args:
+        path: Directory to create
+    """
+    os.makedirs(path, exist_ok=True)
+
+@functools.lru_cache(maxsize=8)
+def _load_registry_file(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parse a registry file once per version of its contents.
+    
+    The file's modification time and size are part of the cache key, so a
+    registry saved or replaced on disk is parsed again on the next load.
+    
+    Args:
+        path: Path to the registry file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Tuple of server entries that have a name. The entries are shared
+        between callers, so they must be copied before being modified.
+    """
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    return tuple(server for server in _servers_from_data(data) if 'name' in server)
+
+class _ServerSearchFields:
+    """
+    Per-server fields used when scoring search results.
+    
+    Built once per index build so scoring doesn't rebuild sets and lowercase
+    strings for every server on every query.
+    """
+    
+    __slots__ = ('capabilities', 'capabilities_lower', 'categories', 'categories_lower',
+                 'description', 'is_official', 'is_documented')
+    
+    def __init__(self, server: Dict[str, Any]):
+        self.capabilities = set(server.get('capabilities', []))
+        self.capabilities_lower = tuple(cap.lower() for cap in self.capabilities)
+        self.categories = set(server.get('categories', []))
+        self.categories_lower = tuple(cat.lower() for cat in self.categories)
+        self.description = server.get('description', '').lower()
+        self.is_official = server.get('official', False)
+        self.is_documented = 'examples' in server or 'use_cases' in server
+
 class Registry:
     """
     Enhanced Registry for MCP servers.
@@ -51,16 +158,14 @@ class Registry:
         
         # Use the local registry.json file in our package directory if no custom path is provided
         if registry_file is None:
-            import importlib.resources
-            package_dir = Path(__file__).parent
-            self.registry_file = package_dir / 'registry' / 'servers.json'
+            self.registry_file = DEFAULT_REGISTRY_FILE
         else:
             self.registry_file = registry_file
             
         self.registry_url = registry_url or "https://raw.githubusercontent.com/stateofmika/registry/main/servers.json"
         
         # Create necessary directories
-        os.makedirs(self.cache_dir, exist_ok=True)
+        _ensure_directory(str(self.cache_dir))
         
         # Dictionary to store server data
         self.servers: Dict[str, Dict[str, Any]] = {}
@@ -70,10 +175,21 @@ class Registry:
         self.capability_index: Dict[str, List[str]] = defaultdict(list)
         self.keyword_index: Dict[str, List[str]] = defaultdict(list)
         self.description_tokens: Dict[str, List[str]] = {}
+        self._search_fields: Dict[str, _ServerSearchFields] = {}
+        self._servers_by_lower_name: Dict[str, Dict[str, Any]] = {}
         self.official_servers: List[str] = []
         self.all_categories: Set[str] = set()
         self.all_capabilities: Set[str] = set()
         
+        # Remote fetch state, so repeated updates don't re-download an unchanged registry
+        self.update_ttl = 60.0
+        self._last_fetch_time: Optional[float] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        
+        # HTTP session shared by remote registry requests, created on first use
+        self._session: Optional['aiohttp.ClientSession'] = None
+        
         # Load the registry from local file
         self._load_registry()
         
@@ -83,44 +199,34 @@ class Registry:
     
     def _load_registry(self) -> None:
         """Load the registry from the local file or create a new one."""
-        if self.registry_file.exists():
-            try:
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
-                    
-                # The new format might have server entries in different places
-                # 1. Check for the new format with categorized sections
-                if isinstance(data, dict):
-                    # Extract servers array
-                    servers_list = data.get('servers', [])
-                    
-                    # Also check if there are frameworks and utilities lists
-                    for section in ['frameworks', 'utilities']:
-                        if section in data:
-                            # Add a section identifier to each item in these lists
-                            for item in data[section]:
-                                item['_section'] = section
-                            servers_list.extend(data[section])
-                            
-                # 2. Check for the old format (just an array of servers)
-                elif isinstance(data, list):
-                    servers_list = data
-                # 3. Finally, check for the old format with servers in a 'servers' property
-                elif isinstance(data, dict) and 'servers' in data and isinstance(data['servers'], list):
-                    servers_list = data['servers']
-                else:
-                    servers_list = []
-                
-                # Convert from list to dict with server name as key
-                self.servers = {server['name']: server for server in servers_list if 'name' in server}
-                
-                logger.info(f"Loaded {len(self.servers)} servers from registry")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Error loading registry: {e}")
-                self.servers = {}
-        else:
+        # A single stat both checks that the file exists and keys the parse cache
+        try:
+            stat = self.registry_file.stat()
+        except FileNotFoundError:
+            # Keep any servers already in memory, e.g. fetched but not saved
             logger.info("No local registry found")
+            return
+            
+        try:
+            servers_list = _load_registry_file(str(self.registry_file), stat.st_mtime_ns, stat.st_size)
+            
+            # Convert from list to dict with server name as key, deep-copying the
+            # cached entries so changes made by this instance (including to nested
+            # lists such as capabilities) don't leak into others
+            self.servers = {server['name']: copy.deepcopy(server) for server in servers_list}
+            self._build_name_index()
+            
+            logger.info(f"Loaded {len(self.servers)} servers from registry")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Error loading registry: {e}")
             self.servers = {}
+            self._build_name_index()
+    
+    def _build_name_index(self) -> None:
+        """Index the servers by lowercased name for case-insensitive lookups."""
+        self._servers_by_lower_name = {}
+        for server_name, server_data in self.servers.items():
+            self._servers_by_lower_name.setdefault(server_name.lower(), server_data)
     
     def _build_indexes(self) -> None:
         """Build search indexes for fast lookups."""
@@ -129,6 +235,7 @@ class Registry:
         self.capability_index = defaultdict(list)
         self.keyword_index = defaultdict(list)
         self.description_tokens = {}
+        self._search_fields = {}
         self.official_servers = []
         self.all_categories = set()
         self.all_capabilities = set()
@@ -162,6 +269,9 @@ class Registry:
                 tokens = [token.lower() for token in re.split(r'\W+', description) if token]
                 self.description_tokens[server_name] = tokens
             
+            # Precompute the fields used for scoring
+            self._search_fields[server_name] = _ServerSearchFields(server_data)
+            
             # Track official servers
             if server_data.get('official', False):
                 self.official_servers.append(server_name)
@@ -192,8 +302,10 @@ class Registry:
             servers = []
             
             for server in servers_list:
-                # Remove the _section marker if it exists
-                section = server.pop('_section', None) if isinstance(server, dict) else None
+                # Leave out the _section marker, keeping it on the in-memory entry for later saves
+                section = server.get('_section') if isinstance(server, dict) else None
+                if section:
+                    server = {key: value for key, value in server.items() if key != '_section'}
                 
                 if section == 'frameworks':
                     frameworks.append(server)
@@ -210,8 +322,21 @@ class Registry:
             
             result['servers'] = servers
             
-            with open(self.registry_file, 'w') as f:
-                json.dump(result, f, indent=2)
+            payload = _json_dumps(result)
+            
+            # Write to a temporary file and swap it in so readers never see a partial file
+            tmp_file = self.registry_file.with_name(self.registry_file.name + '.tmp')
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.registry_file)
+            except IOError:
+                # Don't leave a partial temporary file behind
+                try:
+                    tmp_file.unlink()
+                except IOError:
+                    pass
+                raise
                 
             logger.info(f"Saved {len(servers_list)} servers to registry")
         except IOError as e:
@@ -221,63 +346,108 @@ class Registry:
         """
         Update the registry from the remote source.
         
+        Without force, servers already in memory or in the local file are
+        used as they are. With force, the remote registry is checked even if
+        servers are loaded, using a conditional request so an unchanged
+        registry is not downloaded again; checks within update_ttl seconds
+        of the last fetch are skipped.
+        
         Args:
-            force: Force update even if the registry was recently updated
+            force: Check the remote registry even if servers are already loaded
             
         Returns:
             True if the registry was updated, False otherwise
         """
-        # If we already have servers and we're not forcing an update,
-        # consider the registry to be up-to-date
-        if self.servers and not force:
-            return False
+        if not force:
+            # If we already have servers, consider the registry to be up-to-date
+            if self.servers:
+                return False
+                
+            # First try to load from local file
+            self._load_registry()
             
-        # First try to load from local file
-        self._load_registry()
-        
-        # If we have servers now, consider it updated
+            # If we have servers now, consider it updated
+            if self.servers:
+                # Make sure indexes are built
+                self._build_indexes()
+                return True
+        elif not self.servers:
+            # Start from the local file so a failed fetch still leaves usable data
+            self._load_registry()
+            if self.servers:
+                self._build_indexes()
+            
+        # The fetch TTL and conditional requests only apply when there is data to keep;
+        # without servers, always download the full registry
+        headers = {}
         if self.servers:
-            # Make sure indexes are built
-            self._build_indexes()
-            return True
+            # Skip the remote fetch if it was attempted within the TTL
+            if self._last_fetch_time is not None and time.monotonic() - self._last_fetch_time < self.update_ttl:
+                logger.debug("Remote registry fetched recently, skipping update")
+                return False
+                
+            # Only download the registry again if it changed since the last fetch
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
             
         # Otherwise, try to fetch from remote
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.registry_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Handle different formats as in _load_registry
-                        servers_list = []
-                        if isinstance(data, dict):
-                            servers_list = data.get('servers', [])
-                            for section in ['frameworks', 'utilities']:
-                                if section in data:
-                                    for item in data[section]:
-                                        item['_section'] = section
-                                    servers_list.extend(data[section])
-                        elif isinstance(data, list):
-                            servers_list = data
-                            
-                        # Convert from list to dict with server name as key
-                        self.servers = {server['name']: server for server in servers_list if 'name' in server}
-                        
-                        # Build the indexes
-                        self._build_indexes()
-                        
-                        # Save the updated registry
-                        self._save_registry()
+            session = await self._get_session()
+            async with session.get(self.registry_url, headers=headers) as response:
+                if response.status == 304:
+                    self._last_fetch_time = time.monotonic()
+                    logger.info("Remote registry not modified")
+                    return False
+                elif response.status == 200:
+                    self._last_fetch_time = time.monotonic()
+                    self._etag = response.headers.get('ETag')
+                    self._last_modified = response.headers.get('Last-Modified')
+                    data = await response.json(loads=_json_loads)
+                    
+                    # Handle different formats as in _load_registry
+                    servers_list = _servers_from_data(data)
                         
-                        logger.info(f"Updated registry with {len(self.servers)} servers")
-                        return True
-                    else:
-                        logger.warning(f"Failed to update registry: HTTP {response.status}")
-                        return False
+                    # Convert from list to dict with server name as key
+                    self.servers = {server['name']: server for server in servers_list if 'name' in server}
+                    self._build_name_index()
+                    
+                    # Build the indexes
+                    self._build_indexes()
+                    
+                    # Save the updated registry
+                    self._save_registry()
+                    
+                    logger.info(f"Updated registry with {len(self.servers)} servers")
+                    return True
+                else:
+                    logger.warning(f"Failed to update registry: HTTP {response.status}")
+                    return False
         except Exception as e:
             logger.error(f"Error updating registry: {e}")
             return False
     
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            The aiohttp session used for remote registry requests
+        """
+        if self._session is None or self._session.closed:
+            # Imported here so loading the registry doesn't pay for aiohttp's import
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
     def get_all_servers(self) -> List[Dict[str, Any]]:
         """
         Get all servers in the registry.
@@ -298,21 +468,21 @@ class Registry:
         # In a real implementation, we'd check which ones are installed
         return self.get_all_servers()
         
-    def is_server_installed(self, server_name: str) -> bool:
+    def _get_pip_package_name(self, server_name: str) -> Optional[str]:
         """
-        Check if a server is installed
+        Resolve the pip package to look for when checking if a server is installed
         
         Args:
             server_name: Name of the server to check
             
         Returns:
-            True if the server is installed, False otherwise
+            The pip package name, or None if the server can't be checked with pip
         """
         logger.info(f"✓ Checking if server '{server_name}' is installed...")
         
         if server_name not in self.servers:
             logger.warning(f"✗ Server '{server_name}' not found in registry")
-            return False
+            return None
             
         server = self.servers[server_name]
         
@@ -320,92 +490,158 @@ class Registry:
         install_info = server.get("install") or server.get("installation", {})
         if not install_info:
             logger.warning(f"✗ No installation information for server '{server_name}'")
-            return False
+            return None
             
         install_type = install_info.get("type")
         logger.info(f"✓ Server '{server_name}' has installation type: {install_type}")
         
-        # For pip packages, check if the package is installed using pip list
-        if install_type == "pip":
-            package_name = install_info.get("package", "")
-            
-            # Extract package name from GitHub URL if necessary
-            if "github.com" in package_name:
-                # Try to extract the repo name from the URL
-                try:
-                    repo_parts = package_name.split("/")
-                    # Extract just the repository name without .git extension
-                    pip_package_name = repo_parts[-1].replace(".git", "")
-                    logger.info(f"✓ Extracted pip package name from GitHub URL: {pip_package_name}")
-                except Exception as e:
-                    logger.error(f"✗ Error extracting package name: {e}")
-                    pip_package_name = package_name
-            else:
-                pip_package_name = package_name
-                
-            # Special case for mcp_weather
-            if server_name == "mcp_weather":
-                pip_package_name = "mcp-weather"
-                
-            if not pip_package_name:
-                logger.warning(f"✗ Empty package name for server '{server_name}'")
-                return False
+        # Only pip packages can be checked for now
+        if install_type != "pip":
+            return None
             
-            # Check if the package is in pip list
+        package_name = install_info.get("package", "")
+        
+        # Extract package name from GitHub URL if necessary
+        if "github.com" in package_name:
+            # Try to extract the repo name from the URL
             try:
-                logger.info(f"✓ Checking if '{pip_package_name}' is installed using pip list...")
-                import subprocess
-                import sys
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "list"], 
-                    capture_output=True, 
-                    text=True
-                )
-                if result.returncode != 0:
-                    logger.error(f"✗ Error running pip list: {result.stderr}")
-                    return False
-                    
-                # Check if the package name is in the output
-                package_found = False
-                for line in result.stdout.splitlines():
-                    if pip_package_name.lower() in line.lower():
-                        logger.info(f"✓ Package found in pip list: {line}")
-                        package_found = True
-                        break
-                        
-                if package_found:
-                    logger.info(f"✓ Package '{pip_package_name}' is installed ✅")
-                    return True
-                else:
-                    logger.info(f"✗ Package '{pip_package_name}' is NOT installed ❌")
-                    return False
-                    
+                repo_parts = package_name.split("/")
+                # Extract just the repository name without .git extension
+                pip_package_name = repo_parts[-1].replace(".git", "")
+                logger.info(f"✓ Extracted pip package name from GitHub URL: {pip_package_name}")
             except Exception as e:
-                logger.error(f"✗ Error checking package installation with pip: {e}")
+                logger.error(f"✗ Error extracting package name: {e}")
+                pip_package_name = package_name
+        else:
+            pip_package_name = package_name
+            
+        # Special case for mcp_weather
+        if server_name == "mcp_weather":
+            pip_package_name = "mcp-weather"
+            
+        if not pip_package_name:
+            logger.warning(f"✗ Empty package name for server '{server_name}'")
+            return None
+            
+        return pip_package_name
+        
+    def _check_pip_list(self, pip_package_name: str, returncode: int, stdout: str, stderr: str) -> bool:
+        """
+        Check the output of `pip list` for a package
+        
+        Args:
+            pip_package_name: Name of the package to look for
+            returncode: Exit code of the pip list command
+            stdout: Standard output of the pip list command
+            stderr: Standard error of the pip list command
+            
+        Returns:
+            True if the package is listed, False otherwise
+        """
+        if returncode != 0:
+            logger.error(f"✗ Error running pip list: {stderr}")
+            return False
+            
+        # Check if the package name is in the output
+        lowered_name = pip_package_name.lower()
+        for line in stdout.splitlines():
+            if lowered_name in line.lower():
+                logger.info(f"✓ Package found in pip list: {line}")
+                logger.info(f"✓ Package '{pip_package_name}' is installed ✅")
+                return True
                 
-            # Fallback to the old import check method
+        logger.info(f"✗ Package '{pip_package_name}' is NOT installed ❌")
+        return False
+        
+    def _check_importable(self, pip_package_name: str) -> bool:
+        """
+        Fallback check for a package by importing it
+        
+        Args:
+            pip_package_name: Name of the package to look for
+            
+        Returns:
+            True if the package can be imported, False otherwise
+        """
+        try:
+            # Convert dash to underscore for importing
+            import_name = pip_package_name.replace("-", "_")
+            importlib = __import__("importlib")
+            importlib.util.find_spec(import_name)
+            logger.info(f"✓ Package '{import_name}' is installed (fallback to find_spec)")
+            return True
+        except (ImportError, ModuleNotFoundError, AttributeError):
+            # Try to import directly
             try:
-                # Convert dash to underscore for importing
-                import_name = pip_package_name.replace("-", "_")
-                importlib = __import__("importlib")
-                importlib.util.find_spec(import_name)
-                logger.info(f"✓ Package '{import_name}' is installed (fallback to find_spec)")
+                __import__(import_name)
+                logger.info(f"✓ Package '{import_name}' is installed (fallback to direct import)")
                 return True
-            except (ImportError, ModuleNotFoundError, AttributeError):
-                # Try to import directly
-                try:
-                    __import__(import_name)
-                    logger.info(f"✓ Package '{import_name}' is installed (fallback to direct import)")
-                    return True
-                except:
-                    logger.info(f"✗ Package '{import_name}' is NOT installed ❌")
-                    return False
-                
-        # For npm packages, check if the package is installed with npm list
-        elif install_type == "npm":
-            return False  # Not supported yet
+            except:
+                logger.info(f"✗ Package '{import_name}' is NOT installed ❌")
+                return False
         
-        return False
+    def is_server_installed(self, server_name: str) -> bool:
+        """
+        Check if a server is installed
+        
+        This runs `pip list` synchronously; use is_server_installed_async from
+        coroutines so the event loop isn't blocked.
+        
+        Args:
+            server_name: Name of the server to check
+            
+        Returns:
+            True if the server is installed, False otherwise
+        """
+        pip_package_name = self._get_pip_package_name(server_name)
+        if not pip_package_name:
+            return False
+            
+        # Check if the package is in pip list
+        try:
+            logger.info(f"✓ Checking if '{pip_package_name}' is installed using pip list...")
+            import subprocess
+            result = subprocess.run(
+                [sys.executable, "-m", "pip", "list"], 
+                capture_output=True, 
+                text=True
+            )
+            return self._check_pip_list(pip_package_name, result.returncode, result.stdout, result.stderr)
+        except Exception as e:
+            logger.error(f"✗ Error checking package installation with pip: {e}")
+            
+        # Fallback to the old import check method
+        return self._check_importable(pip_package_name)
+        
+    async def is_server_installed_async(self, server_name: str) -> bool:
+        """
+        Check if a server is installed without blocking the event loop
+        
+        Args:
+            server_name: Name of the server to check
+            
+        Returns:
+            True if the server is installed, False otherwise
+        """
+        pip_package_name = self._get_pip_package_name(server_name)
+        if not pip_package_name:
+            return False
+            
+        # Check if the package is in pip list
+        try:
+            logger.info(f"✓ Checking if '{pip_package_name}' is installed using pip list...")
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "pip", "list",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate()
+            return self._check_pip_list(pip_package_name, process.returncode, stdout.decode(), stderr.decode())
+        except Exception as e:
+            logger.error(f"✗ Error checking package installation with pip: {e}")
+            
+        # Fallback to the old import check method
+        return self._check_importable(pip_package_name)
     
     def search_by_capability(self, capability: str) -> List[Dict[str, Any]]:
         """
@@ -792,15 +1028,15 @@ class Registry:
         if server_name not in self.servers:
             return 0.0
             
-        server = self.servers[server_name]
+        # Get server metadata, precomputed when the indexes were built
+        fields = self._search_fields.get(server_name)
+        if fields is None:
+            fields = _ServerSearchFields(self.servers[server_name])
+        server_capabilities = fields.capabilities
+        server_categories = fields.categories
+        server_description = fields.description
         score = 0.0
         
-        # Get server metadata
-        server_capabilities = set(server.get('capabilities', []))
-        server_categories = set(server.get('categories', []))
-        server_description = server.get('description', '').lower()
-        server_is_official = server.get('official', False)
-        
         # Check for exact capability matches (highest weight)
         if capabilities:
             for capability in capabilities:
@@ -809,9 +1045,10 @@ class Registry:
                 else:
                     # Try fuzzy matching
                     max_similar = 0.0
-                    for server_cap in server_capabilities:
-                        similarity = SequenceMatcher(None, capability.lower(), 
-                                                    server_cap.lower()).ratio()
+                    capability_lower = capability.lower()
+                    for server_cap_lower in fields.capabilities_lower:
+                        similarity = SequenceMatcher(None, capability_lower, 
+                                                    server_cap_lower).ratio()
                         max_similar = max(max_similar, similarity)
                     
                     # Add partial score based on similarity
@@ -825,32 +1062,34 @@ class Registry:
                 else:
                     # Try fuzzy matching
                     max_similar = 0.0
-                    for server_cat in server_categories:
-                        similarity = SequenceMatcher(None, category.lower(), 
-                                                    server_cat.lower()).ratio()
+                    category_lower = category.lower()
+                    for server_cat_lower in fields.categories_lower:
+                        similarity = SequenceMatcher(None, category_lower, 
+                                                    server_cat_lower).ratio()
                         max_similar = max(max_similar, similarity)
                     
                     # Add partial score based on similarity
                     score += 2.5 * max_similar
         
         # Check for search terms in capabilities and description
+        server_name_lower = server_name.lower()
         for term in search_terms:
             # Check server name (direct substring match)
-            if term in server_name.lower():
+            if term in server_name_lower:
                 score += 2.0
             
             # Check if term exactly matches any capability
-            for capability in server_capabilities:
-                if term == capability.lower():
+            for capability_lower in fields.capabilities_lower:
+                if term == capability_lower:
                     score += 3.0
-                elif term in capability.lower():
+                elif term in capability_lower:
                     score += 1.5
             
             # Check if term exactly matches any category
-            for category in server_categories:
-                if term == category.lower():
+            for category_lower in fields.categories_lower:
+                if term == category_lower:
                     score += 2.0
-                elif term in category.lower():
+                elif term in category_lower:
                     score += 1.0
             
             # Check if term is in the description (with position weighting)
@@ -867,11 +1106,11 @@ class Registry:
                     score += 0.2 * min(5, occurrences - 1)  # Cap at 5 occurrences
         
         # Bonus for official servers
-        if server_is_official:
+        if fields.is_official:
             score += 2.0
             
         # Bonus for servers with examples or use_cases (shows it's well-documented)
-        if 'examples' in server or 'use_cases' in server:
+        if fields.is_documented:
             score += 1.0
             
         return score
@@ -886,20 +1125,27 @@ class Registry:
         Returns:
             List of matching servers
         """
-        logger.debug(f"Finding servers for capability: {capability}")
+        logger.debug("Finding servers for capability: %s", capability)
         return self.search_by_capability(capability)
     
     def get_server_by_name(self, server_name: str) -> Optional[Dict[str, Any]]:
         """
         Get server data by name.
         
+        Exact names are looked up first; otherwise the name is matched
+        case-insensitively.
+        
         Args:
             server_name: Name of the server
             
         Returns:
             Server data or None if not found
         """
-        return self.servers.get(server_name)
+        server = self.servers.get(server_name)
+        if server is not None:
+            return server
+            
+        return self._servers_by_lower_name.get(server_name.lower())
     
     def get_all_categories(self) -> List[str]:
         """
@@ -184,4 +184,5 @@ class SoMAgent:
                 
     async def aclose(self):
         """Close all connections and clean up resources."""
-        await self.connector.aclose() 
\ No newline at end of file
+        await self.connector.aclose()
+        await self.registry.aclose() 
\ No newline at end of file
@@ -19,22 +19,32 @@ Each step is logged for better visualization of the process.
 import os
 import sys
 import json
+import time
+import atexit
 import asyncio
 import logging
-from datetime import datetime
+from logging.handlers import MemoryHandler
+from datetime import datetime, timedelta
 from pathlib import Path
-from contextlib import AsyncExitStack
 from typing import Dict, Any, Optional
 
 # Add parent directory to path to import state_of_mika
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Set up logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Buffer records for debug.log and write them in batches (or immediately on errors)
+file_handler = logging.FileHandler("debug.log")
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+memory_handler = MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+atexit.register(memory_handler.flush)
+
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler("debug.log"),
+        memory_handler,
         logging.StreamHandler()
     ]
 )
@@ -138,6 +148,15 @@ class MockMikaAdapter:
                 "error": "Unknown capability or server unavailable"
             }
 
+# Wall-clock time at startup, used as the base for log timestamps
+START_TIME = datetime.now()
+START_MONOTONIC_NS = time.monotonic_ns()
+
+def timestamp():
+    """Return the current time as 'YYYY-MM-DD HH:MM:SS' without re-reading the wall clock."""
+    elapsed = timedelta(microseconds=(time.monotonic_ns() - START_MONOTONIC_NS) // 1000)
+    return (START_TIME + elapsed).isoformat(sep=' ', timespec='seconds')
+
 # Test requests
 TEST_REQUESTS = [
     "What's the weather like in Paris today?",
@@ -145,10 +164,36 @@ TEST_REQUESTS = [
     "I'd like to know the weather conditions in Tokyo."
 ]
 
-async def process_llm_request(request):
+async def setup_components():
+    """Create the components shared by all test requests.
+    
+    Returns:
+        Tuple of the connector and the adapter set up to process requests
+    """
+    # Step 1: Initialize the components
+    registry = Registry()
+    installer = Installer(registry)
+    connector = Connector(registry, installer)
+    
+    # Step 2: Load registry data
+    await registry.update()
+    
+    # Step 3: Create and set up the adapter
+    # Use mock adapter when USE_MOCK_DATA is set
+    if os.environ.get("USE_MOCK_DATA") == "true":
+        adapter = MockMikaAdapter(connector)
+    else:
+        adapter = MikaAdapter(connector=connector)
+        
+    await adapter.setup()
+    
+    return connector, adapter
+
+async def process_llm_request(adapter, request):
     """Process an LLM request using the real components or mock components.
     
     Args:
+        adapter: The adapter set up by setup_components
         request: The natural language request to process
         
     Returns:
@@ -156,93 +201,104 @@ async def process_llm_request(request):
     """
     logger = logging.getLogger('process')
     logger.info(f"Processing LLM request: {request}")
-    logger.info(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # Create an AsyncExitStack for proper resource management
-    async with AsyncExitStack() as stack:
-        try:
-            # Step 1: Initialize the components
-            registry = Registry()
-            installer = Installer(registry)
-            connector = Connector(registry, installer)
-            
-            # Step 2: Load registry data
-            await registry.update()
-            
-            # Step 3: Create and set up the adapter
-            # Use mock adapter when USE_MOCK_DATA is set
-            if os.environ.get("USE_MOCK_DATA") == "true":
-                adapter = MockMikaAdapter(connector)
-            else:
-                adapter = MikaAdapter(connector=connector)
-                
-            await adapter.setup()
-            
-            # Step 4: Process the request with the adapter
-            logger.info("Sending request to adapter for processing")
-            response = await adapter.process_request(request)
-            
-            # Step 5: Log the result
-            if response.get("success", False):
-                result_logger.info(f"Request processing completed successfully")
-            else:
-                result_logger.warning(f"Request processing failed: {response.get('error', 'Unknown error')}")
-            
-            # Convert response to dictionary if it's not already one
-            try:
-                # Check if response is a CallToolResult or other custom object
-                if hasattr(response, '__dict__') and not isinstance(response, dict):
-                    # Convert to dictionary for JSON serialization
-                    response_dict = vars(response)
-                    result_logger.debug(f"Final result (converted from object): {json.dumps(response_dict, indent=2)}")
-                else:
-                    result_logger.debug(f"Final result: {json.dumps(response, indent=2)}")
-            except (TypeError, AttributeError) as e:
-                # If we can't serialize, just log the object type
-                result_logger.debug(f"Final result: <Object of type {type(response).__name__} - not JSON serializable>")
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error processing request: {str(e)}", exc_info=True)
-            return {"success": False, "error": str(e)}
-        finally:
-            # Step 6: Clean up resources
-            if 'connector' in locals():
-                await connector.aclose()
-            logger.info(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-async def run_tests():
-    """Run the end-to-end tests."""
-    print("\n==== Running End-to-End Tests with Real APIs ====\n")
+    logger.info(f"Start time: {timestamp()}")
     
-    for i, request in enumerate(TEST_REQUESTS, 1):
-        print(f"\nTest {i}: '{request}'")
-        response = await process_llm_request(request)
+    try:
+        # Step 4: Process the request with the adapter
+        logger.info("Sending request to adapter for processing")
+        response = await adapter.process_request(request)
         
-        success = response.get("success", False)
-        error = response.get("error", "Unknown error")
-        capability = response.get("capability", "Unknown")
-        
-        print(f"Success: {success}")
-        if not success:
-            print(f"Error: {error}")
-        print(f"Capability: {capability}")
+        # Step 5: Log the result
+        if response.get("success", False):
+            result_logger.info(f"Request processing completed successfully")
+        else:
+            result_logger.warning(f"Request processing failed: {response.get('error', 'Unknown error')}")
         
-        # Handle result serialization
-        result = response.get('result', {})
+        # Convert response to dictionary if it's not already one
         try:
-            if hasattr(result, '__dict__') and not isinstance(result, dict):
+            # Check if response is a CallToolResult or other custom object
+            if hasattr(response, '__dict__') and not isinstance(response, dict):
                 # Convert to dictionary for JSON serialization
-                result_dict = vars(result)
-                print(f"Result: {json.dumps(result_dict, indent=2)}")
+                response_dict = vars(response)
+                result_logger.debug(f"Final result (converted from object): {json.dumps(response_dict, indent=2)}")
             else:
-                print(f"Result: {json.dumps(result, indent=2)}")
+                result_logger.debug(f"Final result: {json.dumps(response, indent=2)}")
         except (TypeError, AttributeError) as e:
-            # If we can't serialize, just print the object type
-            print(f"Result: <Object of type {type(result).__name__} - not directly serializable>")
+            # If we can't serialize, just log the object type
+            result_logger.debug(f"Final result: <Object of type {type(response).__name__} - not JSON serializable>")
+        
+        return response
         
-        print("-" * 50)
+    except Exception as e:
+        logger.error(f"Error processing request: {str(e)}", exc_info=True)
+        return {"success": False, "error": str(e)}
+    finally:
+        logger.info(f"End time: {timestamp()}")
+
+def format_test_result(i, request, response):
+    """Format the outcome of a single test request.
+    
+    Args:
+        i: Number of the test
+        request: The request that was processed
+        response: The response returned for the request
+        
+    Returns:
+        The report for the test as a single block of text
+    """
+    lines = [f"\nTest {i}: '{request}'"]
+    
+    success = response.get("success", False)
+    error = response.get("error", "Unknown error")
+    capability = response.get("capability", "Unknown")
+    
+    lines.append(f"Success: {success}")
+    if not success:
+        lines.append(f"Error: {error}")
+    lines.append(f"Capability: {capability}")
+    
+    # Handle result serialization
+    result = response.get('result', {})
+    try:
+        if hasattr(result, '__dict__') and not isinstance(result, dict):
+            # Convert to dictionary for JSON serialization
+            result_dict = vars(result)
+            lines.append(f"Result: {json.dumps(result_dict, indent=2)}")
+        else:
+            lines.append(f"Result: {json.dumps(result, indent=2)}")
+    except (TypeError, AttributeError) as e:
+        # If we can't serialize, just report the object type
+        lines.append(f"Result: <Object of type {type(result).__name__} - not directly serializable>")
+    
+    lines.append("-" * 50)
+    return "\n".join(lines)
+
+async def run_tests():
+    """Run the end-to-end tests."""
+    print("\n==== Running End-to-End Tests with Real APIs ====\n")
+    
+    # Set up the registry, connector and adapter once for all requests
+    try:
+        connector, adapter = await setup_components()
+    except Exception as e:
+        logging.getLogger('process').error(f"Error setting up components: {str(e)}", exc_info=True)
+        return
+    
+    # Process the requests one after another in this task: the connector's MCP
+    # connections must be closed by the task that opened them, and requests for
+    # the same capability would otherwise race to launch the same server
+    try:
+        responses = [await process_llm_request(adapter, request) for request in TEST_REQUESTS]
+    finally:
+        # Step 6: Clean up resources
+        await connector.aclose()
+        await connector.registry.aclose()
+    
+    # Print the results in request order once they are all done
+    print("\n".join(
+        format_test_result(i, request, response)
+        for i, (request, response) in enumerate(zip(TEST_REQUESTS, responses), 1)
+    ))
         
     print("\n==== End-to-End Tests Completed ====\n")
 
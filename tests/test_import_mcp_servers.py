@@ -0,0 +1,28 @@
+"""
+Tests for the emoji attribute parsing in import_mcp_servers.py.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import import_mcp_servers
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from import_mcp_servers import classify_attributes
+
+def test_classify_attributes_maps_each_field():
+    assert classify_attributes("🎖️ 🐍 ☁️ 🍎") == {
+        "is_official": True,
+        "language": "python",
+        "scope": "cloud",
+        "os": "macos",
+    }
+
+def test_classify_attributes_prefers_map_order_over_text_order():
+    # When two emojis compete for one field, the one listed first in its map wins
+    assert classify_attributes("🏠 ☁️") == {"scope": "cloud"}
+    assert classify_attributes("📇 🐍") == {"language": "python"}
+    assert classify_attributes("🪟 🍎") == {"os": "macos"}
+
+def test_classify_attributes_ignores_variation_selectors():
+    assert classify_attributes("☁ 🏎") == {"scope": "cloud", "language": "go"}
@@ -0,0 +1,107 @@
+"""
+Tests for registry loading and remote updates in the State of Mika SDK.
+
+For remote updates the HTTP session is replaced with a stub that records the request headers
+and replies with a scripted status, so no network access is needed.
+"""
+
+import json
+
+import pytest
+
+from state_of_mika.registry import Registry
+
+REMOTE_REGISTRY = {
+    "servers": [
+        {"name": "mcp_weather", "description": "Weather forecasts", "capabilities": ["weather"]}
+    ]
+}
+
+class StubResponse:
+    """Minimal stand-in for an aiohttp response."""
+    
+    def __init__(self, status, headers=None, data=None):
+        self.status = status
+        self.headers = headers or {}
+        self._data = data
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def json(self, loads=None):
+        return self._data
+
+class StubSession:
+    """Session stub that records request headers and replays scripted responses."""
+    
+    closed = False
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+    
+    def get(self, url, headers=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+def make_registry(tmp_path, session):
+    """Create a registry without a local file that uses the given session."""
+    registry = Registry(registry_file=tmp_path / "servers.json", cache_dir=tmp_path)
+    
+    async def get_session():
+        return session
+    
+    registry._get_session = get_session
+    return registry
+
+@pytest.mark.asyncio
+async def test_forced_update_sends_conditional_request(tmp_path):
+    session = StubSession(
+        StubResponse(200, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}, REMOTE_REGISTRY),
+        StubResponse(304),
+    )
+    registry = make_registry(tmp_path, session)
+    
+    # The first fetch has nothing to validate against
+    assert await registry.update(force=True) is True
+    assert session.sent_headers == [{}]
+    assert "mcp_weather" in registry.servers
+    
+    # A forced update within the TTL doesn't contact the remote registry
+    assert await registry.update(force=True) is False
+    assert len(session.sent_headers) == 1
+    
+    # After the TTL the remote registry is revalidated with the stored validators
+    registry.update_ttl = 0
+    assert await registry.update(force=True) is False
+    assert session.sent_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Oct 2025 00:00:00 GMT",
+    }
+    
+    # A 304 keeps the servers already loaded
+    assert "mcp_weather" in registry.servers
+
+@pytest.mark.asyncio
+async def test_update_without_force_keeps_loaded_servers(tmp_path):
+    session = StubSession(StubResponse(200, {"ETag": '"v1"'}, REMOTE_REGISTRY))
+    registry = make_registry(tmp_path, session)
+    
+    assert await registry.update() is True
+    assert await registry.update() is False
+    assert session.sent_headers == [{}]
+
+def test_registries_loaded_from_one_file_dont_share_entries(tmp_path):
+    registry_file = tmp_path / "servers.json"
+    registry_file.write_text(json.dumps(REMOTE_REGISTRY))
+    
+    first = Registry(registry_file=registry_file, cache_dir=tmp_path)
+    first.servers["mcp_weather"]["capabilities"].append("forecast")
+    first.servers["mcp_weather"]["description"] = "Changed"
+    
+    second = Registry(registry_file=registry_file, cache_dir=tmp_path)
+    assert second.servers["mcp_weather"]["capabilities"] == ["weather"]
+    assert second.servers["mcp_weather"]["description"] == "Weather forecasts"